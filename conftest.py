@@ -0,0 +1,11 @@
+"""Shared pytest fixtures for the simulation tests."""
+
+from pytest import fixture
+
+from simulation import Simulation
+
+
+@fixture
+def sim():
+    """A fresh Simulation for each test that advances or mutates one."""
+    return Simulation()
@@ -1,4 +1,4 @@
-#!/usr/bin/env python
+#!/usr/bin/env python3
 
 """
 An example scenario of Power Up game scoring simulation.
@@ -125,12 +125,11 @@ def robot_player(robot):
         while True:
             yield "done"
 
-    # Here's one way to pick a different player for each Robot.
-    # Alternatively, map tuples (alliance, robot.position) to functions.
-    # Or make them methods in a class then use getattr() for lookup.
-    generator = {'RED 1 Robot': player1, 'BLUE 1 Robot': player1,
-                 'RED 2 Robot': player2, 'BLUE 2 Robot': player2,
-                 'RED 3 Robot': red3,    'BLUE 3 Robot': blue3}[robot.name]()
+    # Pick a player for this Robot by (alliance, position) table index.
+    # Alternatively, make them methods in a class then use getattr() for lookup.
+    players = ((player1, player2, red3),
+               (player1, player2, blue3))
+    generator = players[alliance.index][robot.position - 1]()
     robot.set_player(generator)
 
 
@@ -1,4 +1,4 @@
-#!/usr/bin/env python
+#!/usr/bin/env python3
 
 """
 FRC (FIRST Robotics) Power Up game score simulation.
@@ -7,11 +7,12 @@ TODO: Split this file into framework simulation.py, agents, and game.py.
 TODO: Support random distributions for action duration and success.
 """
 
-from collections import namedtuple, OrderedDict
+from collections import deque, namedtuple
 import csv
-from enum import Enum  # PyPI enum34
-import itertools
+from enum import Enum
+from functools import lru_cache
 import os.path
+from sys import intern
 
 AUTONOMOUS_SECS = 15
 TELEOP_SECS = 2 * 60 + 15
@@ -23,17 +24,21 @@ CROSS_LINE_AUTO_POINTS = 5
 GAIN_SWITCH_AUTO_POINTS = 2
 GAIN_SCALE_AUTO_POINTS = 2
 
+_IDLE_BEHAVIOR = '--'  # behavior shown for an Agent with no player generator
+
 
 class Color(str):
-    """An alliance color name that supports a .opposite property."""
+    """An alliance color name that supports .opposite and .index properties."""
     def __init__(self, name):
-        super(Color, self).__init__(name)
+        super().__init__()
         self.opposite = None  # filled in after creating the instances
+        self.index = None  # a small int for indexing tables by alliance
 
 
 # Singleton alliance Color objects.
 RED, BLUE = Color('RED'), Color('BLUE')
 RED.opposite, BLUE.opposite = BLUE, RED
+RED.index, BLUE.index = 0, 1
 ALLIANCES = (RED, BLUE)
 
 # FMS start-of-match choices.
@@ -72,8 +77,11 @@ Location = Enum(
 TRAVEL_TIMES = dict()  # map (location1, location2) -> Robot travel time in seconds
 
 
+@lru_cache(maxsize=None)
 def find_location(pattern, *args):
-    """Find a Location by name pattern with substitution *args."""
+    """Find a Location by name pattern with substitution *args.
+    Memoized, since the same few dozen lookups recur every match.
+    """
     return Location[pattern.format(*args)]
 
 
@@ -126,29 +134,139 @@ def _init_locations():
 _init_locations()
 
 
+def _build_travel_matrix():
+    """Flatten TRAVEL_TIMES into a tuple-of-tuples indexed by the two
+    Location values, with None for non-adjacent pairs. An indexed load
+    beats hashing a (location1, location2) tuple in the driving hot path.
+    """
+    size = len(Location) + 1  # Location values are 1-based
+    matrix = [[None] * size for _ in range(size)]
+    for (location1, location2), time in TRAVEL_TIMES.items():
+        matrix[location1.value][location2.value] = time
+    return tuple(tuple(row) for row in matrix)
+
+
+TRAVEL_MATRIX = _build_travel_matrix()
+
+
+def travel_time(location1, location2):
+    """Return the direct-path travel time in seconds between two
+    Locations via the flat TRAVEL_MATRIX, or raise KeyError (like the
+    TRAVEL_TIMES dict) if there's no direct path.
+    """
+    time = TRAVEL_MATRIX[location1.value][location2.value]
+    if time is None:
+        raise KeyError((location1, location2))
+    return time
+
+
+def _build_route_tables():
+    """Floyd-Warshall all-pairs shortest paths over the direct-path
+    graph: a total travel-time matrix and a next-hop matrix for route
+    reconstruction, both indexed like TRAVEL_MATRIX. ~22^3 int ops,
+    negligible at import time.
+    """
+    size = len(Location) + 1  # Location values are 1-based
+    times = [list(row) for row in TRAVEL_MATRIX]
+    next_hops = [[None] * size for _ in range(size)]
+    for location1 in Location:
+        row = times[location1.value]
+        for location2 in Location:
+            if row[location2.value] is not None:
+                next_hops[location1.value][location2.value] = location2
+
+    values = [loc.value for loc in Location]
+    for k in values:
+        for i in values:
+            ik = times[i][k]
+            if ik is None:
+                continue
+            row_i, row_k = times[i], times[k]
+            for j in values:
+                kj = row_k[j]
+                if kj is not None and (row_i[j] is None or ik + kj < row_i[j]):
+                    row_i[j] = ik + kj
+                    next_hops[i][j] = next_hops[i][k]
+    return (tuple(tuple(row) for row in times),
+            tuple(tuple(row) for row in next_hops))
+
+
+SHORTEST_TIME_MATRIX, NEXT_HOP_MATRIX = _build_route_tables()
+
+_ROUTE_CACHE = {}  # map (origin, destination) -> tuple of Location hops
+
+
+def _shortest_route(origin, destination):
+    """Walk NEXT_HOP_MATRIX to the quickest hop sequence from origin to
+    destination, excluding origin and ending with destination. Raises
+    KeyError if there's no route.
+    """
+    hops = []
+    location = origin
+    next_row = NEXT_HOP_MATRIX
+    while location is not destination:
+        location = next_row[location.value][destination.value]
+        if location is None:
+            raise KeyError((origin, destination))
+        hops.append(location)
+    return tuple(hops)
+
+
+def find_route(origin, destination):
+    """Find the quickest sequence of direct-path hops from origin to
+    destination. Memoized, since players re-plan the same routes every
+    match.
+    """
+    key = (origin, destination)
+    route = _ROUTE_CACHE.get(key)
+    if route is None:
+        route = _ROUTE_CACHE[key] = _shortest_route(origin, destination)
+    return route
+
+
+# Initial Cubes on the field; Locations not listed start empty.
+INITIAL_CUBES = {
+    Location.RED_SWITCH_FENCE: 6, Location.BLUE_SWITCH_FENCE: 6,
+    Location.RED_POWER_CUBE_ZONE: 10, Location.BLUE_POWER_CUBE_ZONE: 10,
+}
+
+
 def typename(value):
     """Return the name of value's type without any module name."""
     return type(value).__name__
 
 
+_SCORE_PICK_CACHE = {}  # map (color, value) -> Score
+
+
 class Score(namedtuple('Score', 'red blue')):
     """An incremental or final match score."""
 
     @classmethod
     def pick(cls, color, value):
-        """Return a Score where RED or BLUE or neither gets the given value."""
-        return cls(value if color is RED else 0, value if color is BLUE else 0)
+        """Return a Score where RED or BLUE or neither gets the given value.
+        Memoized; Score is immutable and the point values are few, so the
+        per-tick scorers can share instances.
+        """
+        key = (color, value)
+        score = _SCORE_PICK_CACHE.get(key)
+        if score is None:
+            score = _SCORE_PICK_CACHE[key] = cls(
+                value if color is RED else 0, value if color is BLUE else 0)
+        return score
 
     def __add__(self, other):
         """Add two Score values. Useful with sum([scores...], Score.ZERO)."""
-        return Score(self.red + other.red, self.blue + other.blue)
+        # Index instead of using the .red/.blue descriptors; this runs
+        # for every agent every time step.
+        return Score(self[0] + other[0], self[1] + other[1])
 
     def wlt_rp(self):
         """Return the Win-Loss-Tie Ranking Point Score for this final point
         Score, e.g. (0, 2) for a BLUE win; (1, 1) for a tie.
         """
-        # __cmp__() returns {-1, 0, 1} for {loss, tie, win}. +1 -> {0, 1, 2}.
-        red_points = self.red.__cmp__(self.blue) + 1
+        # The comparison yields {-1, 0, 1} for {loss, tie, win}. +1 -> {0, 1, 2}.
+        red_points = (self.red > self.blue) - (self.red < self.blue) + 1
         return Score(red_points, 2 - red_points)
 
 
@@ -166,6 +284,9 @@ class Agent(object):
     be formed like "RED 1 Robot" or "BLUE STATION Human" and be useful
     for lookups.
     """
+    __slots__ = ('simulation', 'alliance', 'position', 'name',
+                 'eta', 'scheduled_action', 'scheduled_action_description')
+
     def __init__(self, simulation, alliance, position=''):
         """
         :param alliance: RED, BLUE, or ''
@@ -174,7 +295,7 @@ class Agent(object):
         self.simulation = simulation
         self.alliance = alliance
         self.position = position
-        self.name = "{}{}{}".format(sep(alliance), sep(position), typename(self))
+        self.name = intern("{}{}{}".format(sep(alliance), sep(position), typename(self)))
 
         self.eta = None  # when to perform scheduled_action
         self.scheduled_action = None  # a callable to perform at ETA
@@ -207,7 +328,8 @@ class Agent(object):
     def score(self):
         """
         Returns the Score(red_points, blue_points) earned this time step.
-        Called exactly once per time step.
+        Called exactly once per time step. (Agents that inherit this
+        no-op are skipped by PowerUpGame's scoring loop.)
         """
         return Score.ZERO
 
@@ -271,23 +393,15 @@ class Simulation(object):
 
     def __init__(self):
         self.time = 0
-        self.agents = OrderedDict()
-
-        self.cubes = {}  # map of Location -> # Cubes
-        self.plates = {}  # map of Location -> adjacent Plate to place() Cubes
-        for loc in Location:
-            cubes = 0
-            if loc.name.endswith('_SWITCH_FENCE'):  # initial Cubes on field
-                cubes = 6
-            elif loc.name.endswith('_POWER_CUBE_ZONE'):
-                cubes = 10
-            self.cubes[loc] = cubes
-            self.plates[loc] = None
+        self.autonomous = True  # True during the autonomous period; set by tick()
+        self.agents = {}  # map of Agent name -> Agent
+        self.agent_list = []  # the agents in add() order, for fast iteration
 
-    @property
-    def autonomous(self):
-        """Return True during the autonomous period."""
-        return self.time <= AUTONOMOUS_SECS
+        # map of Location -> # Cubes; bulk-built from the constant dict
+        self.cubes = dict.fromkeys(Location, 0)
+        self.cubes.update(INITIAL_CUBES)
+        # map of Location -> adjacent Plate to place() Cubes
+        self.plates = dict.fromkeys(Location)
 
     def add(self, agent):
         """Add an Agent to this Simulation.
@@ -295,6 +409,7 @@ class Simulation(object):
         """
         assert agent.simulation == self
         self.agents[agent.name] = agent
+        self.agent_list.append(agent)
 
     def tick(self):
         """Advance time by 1 second and update all Agents. In the first
@@ -304,10 +419,19 @@ class Simulation(object):
         if time > GAME_SECS:
             raise GameOver()
         self.time = time
+        self.autonomous = time <= AUTONOMOUS_SECS
 
-        for agent in self.agents.itervalues():
+        for agent in self.agent_list:
             agent.update(time)
 
+    def tick_n(self, n):
+        """Advance time by n seconds, i.e. tick() n times. Hoisting the
+        bound method saves an attribute lookup per iteration.
+        """
+        tick = self.tick
+        for _ in range(n):
+            tick()
+
 
 # NOTE: This won't allow more than 1 action (Cube or driving) at a time
 # by the simple (and a bit fragile) mechanism where these action methods
@@ -318,8 +442,13 @@ class Simulation(object):
 # release it if the action gets cancelled)?
 class Robot(Agent):
     """A Robot Agent, responsible for actions, not decisions."""
+    __slots__ = ('extra_drive_time', 'pickup_time', 'drop_time', 'place_time',
+                 'climb_time', 'location', 'platform_location', 'destination',
+                 'cubes', 'climbed', 'auto_run', 'auto_run_points',
+                 'behavior', 'player')
+
     def __init__(self, simulation, alliance, position, location=None):
-        super(Robot, self).__init__(simulation, alliance, position)
+        super().__init__(simulation, alliance, position)
 
         # The Player can adjust these parameters to model Robot differences.
         self.extra_drive_time = 0  # additional seconds per travel hop
@@ -331,11 +460,14 @@ class Robot(Agent):
         if location is None:
             location = Location.RED_OUTER_ZONE if alliance is RED else Location.BLUE_OUTER_ZONE
         self.location = location
+        self.platform_location = find_location('{}_PLATFORM', alliance)
+        self.destination = None  # where the current drive_to() will arrive
         self.cubes = 0
         self.climbed = ''  # one of {'', 'Climbed', 'Levitated'}
         self.auto_run = ScoreFactor.NOT_YET
+        self.auto_run_points = Score.pick(alliance, CROSS_LINE_AUTO_POINTS)
         self.behavior = ''
-        self.player = itertools.repeat("--")  # a no-op generator
+        self.player = None  # a None player idles; see scheduled_action_done()
 
     def __str__(self):
         return "{} in {} with {} Cube(s)".format(self.name, self.location, self.cubes)
@@ -343,8 +475,7 @@ class Robot(Agent):
     @property
     def at_platform(self):
         """True if the Robot is on (Parked) or above (Climbed) its Platform."""
-        platform = find_location('{}_PLATFORM', self.alliance)
-        return self.location is platform
+        return self.location is self.platform_location
 
     def csv_header(self):
         name = self.name
@@ -366,11 +497,11 @@ class Robot(Agent):
         # scheduled_action to finish.
         if not self.scheduled_action:
             self.scheduled_action_done()  # Start the generator.
-        super(Robot, self).update(time)
+        super().update(time)
 
     def score(self):
         if self.auto_run is ScoreFactor.ACHIEVED:
-            points = Score.pick(self.alliance, 5)
+            points = self.auto_run_points
             self.auto_run = ScoreFactor.COUNTED
         else:
             points = Score.ZERO
@@ -383,7 +514,8 @@ class Robot(Agent):
 
     def scheduled_action_done(self):
         """A scheduled action completed so start the next one."""
-        self.behavior = self.player.next()
+        player = self.player
+        self.behavior = _IDLE_BEHAVIOR if player is None else next(player)
 
     def set_player(self, generator):
         """Set the generator that chooses Robot actions and initialize."""
@@ -401,22 +533,26 @@ class Robot(Agent):
         if isinstance(destination, str):
             destination = find_location(destination, *args)
 
-        def arrive():
-            self.location = destination
-            # Check if this Robot completed the auto-run. Allow 1 extra
-            # second because this completion action runs at the start of
-            # a second, noticing that the Robot finished its drive_to()
-            # step, and actually the Robot's bumper just needs to break
-            # the vertical plane of the Auto Line; the Robot needn't
-            # finish driving into the Inner Zone.
-            if (self.auto_run is ScoreFactor.NOT_YET
-                    and destination.is_inner_zone
-                    and self.time <= AUTONOMOUS_SECS + 1):
-                self.auto_run = ScoreFactor.ACHIEVED
-
-        travel_time = (TRAVEL_TIMES[(self.location, destination)]
-                       + self.extra_drive_time)
-        self.schedule_action(travel_time, arrive, ('drive_to', destination.name))
+        travel_time = TRAVEL_MATRIX[self.location.value][destination.value]
+        if travel_time is None:
+            raise KeyError((self.location, destination))
+        travel_time += self.extra_drive_time
+        self.destination = destination
+        self.schedule_action(travel_time, self._arrive, ('drive_to', destination.name))
+
+    def _arrive(self):
+        """Complete a drive_to(): arrive at the scheduled destination."""
+        destination = self.location = self.destination
+        # Check if this Robot completed the auto-run. Allow 1 extra
+        # second because this completion action runs at the start of
+        # a second, noticing that the Robot finished its drive_to()
+        # step, and actually the Robot's bumper just needs to break
+        # the vertical plane of the Auto Line; the Robot needn't
+        # finish driving into the Inner Zone.
+        if (self.auto_run is ScoreFactor.NOT_YET
+                and destination.is_inner_zone
+                and self.time <= AUTONOMOUS_SECS + 1):
+            self.auto_run = ScoreFactor.ACHIEVED
 
     def drive_path(self, *locations):
         """Drive a sequence of Location steps, yielding after each step."""
@@ -424,14 +560,24 @@ class Robot(Agent):
             self.drive_to(step)
             yield "driving through"
 
+    def drive_route(self, destination):
+        """Drive the quickest multi-hop route to destination, yielding
+        after each hop like drive_path(). The route is planned from the
+        Robot's current Location when driving starts.
+        """
+        for step in find_route(self.location, destination):
+            self.drive_to(step)
+            yield "driving through"
+
     def pickup(self):
         """If there's a Cube here and room in the Robot, pick it up."""
-        def finish():
-            if self.simulation.cubes[self.location] > 0 and self.cubes == 0:
-                self.simulation.cubes[self.location] -= 1
-                self.cubes += 1
+        self.schedule_action(self.pickup_time, self._finish_pickup, 'pickup')
 
-        self.schedule_action(self.pickup_time, finish, 'pickup')
+    def _finish_pickup(self):
+        cubes, location = self.simulation.cubes, self.location
+        if cubes[location] > 0 and self.cubes == 0:
+            cubes[location] -= 1
+            self.cubes += 1
 
     def drop(self):
         """
@@ -439,12 +585,12 @@ class Robot(Agent):
         Exchange Plate, this just drops a Cube on the ground; call place()
         to place the Cube on the adjacent Switch/Scale/Exchange Plate.
         """
-        def finish():
-            if self.cubes > 0:
-                self.simulation.cubes[self.location] += 1
-                self.cubes -= 1
+        self.schedule_action(self.drop_time, self._finish_drop, 'drop')
 
-        self.schedule_action(self.drop_time, finish, 'drop')
+    def _finish_drop(self):
+        if self.cubes > 0:
+            self.simulation.cubes[self.location] += 1
+            self.cubes -= 1
 
     def place(self):
         """
@@ -455,22 +601,22 @@ class Robot(Agent):
         it, including the Exchange conveyor Plate, whether the
         STATION Human is getting them or not.
         """
-        def finish():
-            plate = self.simulation.plates[self.location]
-            if plate is not None and self.cubes > 0:
-                plate.cubes += 1
-                self.cubes -= 1
+        self.schedule_action(self.place_time, self._finish_place, 'place')
 
-        self.schedule_action(self.place_time, finish, 'place')
+    def _finish_place(self):
+        plate = self.simulation.plates[self.location]
+        if plate is not None and self.cubes > 0:
+            plate.cubes += 1
+            self.cubes -= 1
 
     def climb(self):
         """If possible, climb the Scale, canceling driving or any other action."""
-        def finish():
-            if self.at_platform:
-                self.climbed = 'Climbed'
+        if self.at_platform:
+            self.schedule_action(self.climb_time, self._finish_climb, 'climb')
 
+    def _finish_climb(self):
         if self.at_platform:
-            self.schedule_action(self.climb_time, finish, 'climb')
+            self.climbed = 'Climbed'
 
 
 class Human(Agent):
@@ -478,6 +624,12 @@ class Human(Agent):
     A Human player Agent, responsible for actions in the Alliance
     station or at a Portal. Its "player" makes the game decisions.
     """
+    __slots__ = ('get_from_exchange_time', 'put_to_exchange_time',
+                 'put_to_vault_time', 'put_through_portal_time',
+                 'activate_power_up_time', 'vault', 'exchange_plate',
+                 'exchange_zone', 'portal', 'cubes', 'vault_column_name',
+                 'behavior', 'player')
+
     # TODO: Model travel steps in the Alliance station? Currently the
     # Cube actions just include some average travel time.
     def __init__(self, simulation, alliance, position, vault):
@@ -490,7 +642,7 @@ class Human(Agent):
 
         :param position: 'FRONT', 'BACK', or 'STATION'.
         """
-        super(Human, self).__init__(simulation, alliance, position)
+        super().__init__(simulation, alliance, position)
 
         # The Player can adjust these parameters to model Human differences.
         self.get_from_exchange_time = 4
@@ -509,8 +661,9 @@ class Human(Agent):
             self.portal = find_location('{}_{}_PORTAL', alliance, position)
 
         self.cubes = 0  # PowerUpGame will preload Cubes for Portal Humans
+        self.vault_column_name = None  # which Vault column to act on
         self.behavior = ''
-        self.player = itertools.repeat("--")  # a no-op generator
+        self.player = None  # a None player idles; see scheduled_action_done()
 
     def __str__(self):
         return "{} with {} Cube(s)".format(self.name, self.cubes)
@@ -531,11 +684,12 @@ class Human(Agent):
     def update(self, time):
         if not self.scheduled_action:
             self.scheduled_action_done()  # Start the generator.
-        super(Human, self).update(time)
+        super().update(time)
 
     def scheduled_action_done(self):
         """A scheduled action completed so start the next one."""
-        self.behavior = self.player.next()
+        player = self.player
+        self.behavior = _IDLE_BEHAVIOR if player is None else next(player)
 
     def set_player(self, generator):
         """Set the generator that chooses Human actions and initialize."""
@@ -548,62 +702,70 @@ class Human(Agent):
 
     def get_from_exchange(self):
         """Get a Cube from the Exchange Plate."""
-        def finish():
-            if self.exchange_plate.cubes > 0:
-                self.exchange_plate.cubes -= 1
-                self.cubes += 1
-
-        self.schedule_action(self.get_from_exchange_time, finish,
+        self.schedule_action(self.get_from_exchange_time,
+                             self._finish_get_from_exchange,
                              'get from Exchange')
 
+    def _finish_get_from_exchange(self):
+        if self.exchange_plate.cubes > 0:
+            self.exchange_plate.cubes -= 1
+            self.cubes += 1
+
     def put_to_exchange(self):
         """
         Put a Cube through the Exchange Return to the Exchange zone on the field.
         """
-        def finish():
-            if self.cubes > 0:
-                self.cubes -= 1
-                self.simulation.cubes[self.exchange_zone] += 1
-
-        self.schedule_action(self.put_to_exchange_time, finish,
+        self.schedule_action(self.put_to_exchange_time,
+                             self._finish_put_to_exchange,
                              'put to Exchange')
 
+    def _finish_put_to_exchange(self):
+        if self.cubes > 0:
+            self.cubes -= 1
+            self.simulation.cubes[self.exchange_zone] += 1
+
     def put_to_vault(self, column_name):
         """Put a Cube into a Vault column 'force', 'levitate', or 'boost'."""
-        def finish():
-            if self.cubes > 0:
-                self.cubes -= 1
-                self.vault.column_map[column_name].add_cube(1)
-
-        self.schedule_action(self.put_to_vault_time, finish,
+        self.vault_column_name = column_name
+        self.schedule_action(self.put_to_vault_time, self._finish_put_to_vault,
                              'put to {} Vault'.format(column_name))
 
+    def _finish_put_to_vault(self):
+        if self.cubes > 0:
+            self.cubes -= 1
+            self.vault.column_map[self.vault_column_name].add_cube(1)
+
     def put_through_portal(self):
         """Put a Cube through the Portal onto the field."""
-        def finish():
-            if self.cubes > 0:
-                self.cubes -= 1
-                self.simulation.cubes[self.portal] += 1
-
-        self.schedule_action(self.put_through_portal_time, finish,
+        self.schedule_action(self.put_through_portal_time,
+                             self._finish_put_through_portal,
                              'put through Portal')
 
+    def _finish_put_through_portal(self):
+        if self.cubes > 0:
+            self.cubes -= 1
+            self.simulation.cubes[self.portal] += 1
+
     def activate_power_up(self, column_name):
         """Push a Power-up button on a Vault column to try to Activate it."""
-        def finish():
-            self.vault.column_map[column_name].activate()
-
         # The delay models the average time for the Human player to get
         # to the Vault, check the lights and Cubes, and push a button.
-        self.schedule_action(self.activate_power_up_time, finish,
+        self.vault_column_name = column_name
+        self.schedule_action(self.activate_power_up_time,
+                             self._finish_activate_power_up,
                              'activate {} Power-up'.format(column_name))
 
+    def _finish_activate_power_up(self):
+        self.vault.column_map[self.vault_column_name].activate()
+
 
 class Plate(object):
     """
     A Plate holding Cubes on one side of a "seesaw" (Scale or Switch) or
     an Exchange conveyor. Robots can put Cubes on Plates.
     """
+    __slots__ = ('name', 'cubes')
+
     def __init__(self, name):
         self.name = name
         self.cubes = 0
@@ -614,11 +776,16 @@ class Plate(object):
 
 class Scale(Agent):
     """A Scale, also the base class for Switch."""
+    __slots__ = ('power_up_queue', 'front_color', 'front_plate', 'back_plate',
+                 'forced', 'force_alliance', 'boosted', 'boost_alliance',
+                 'previous_owner', 'owner_by_tilt', 'owner_table',
+                 'owner_cache_time', 'owner_cache')
+
     def __init__(self, simulation, power_up_queue, front_color, alliance=''):
         """
         :param front_color: RED or BLUE, selected by the FMS
         """
-        super(Scale, self).__init__(simulation, alliance)
+        super().__init__(simulation, alliance)
         self.power_up_queue = power_up_queue
         self.front_color = front_color
         self.front_plate = Plate(self._plate_name("Front"))
@@ -628,6 +795,18 @@ class Scale(Agent):
         self.boosted, self.boost_alliance = (False, '')
         self.previous_owner = ''
 
+        # The owner for each tilt value + 1, precomputed to keep owner()
+        # from building a tuple every time step. force() swaps owner_table
+        # between the tilt table and an all-one-alliance table so owner()
+        # needn't branch on self.forced.
+        self.owner_by_tilt = (front_color.opposite, '', front_color)
+        self.owner_table = self.owner_by_tilt
+
+        # owner() memo for the current tick; score() and csv_row() both
+        # ask. Invalidated by the clock and by force()/boost().
+        self.owner_cache_time = -1
+        self.owner_cache = ''
+
         self._setup_locations()
 
     def _plate_name(self, front_back):
@@ -671,7 +850,9 @@ class Scale(Agent):
         if self.autonomous:
             raise RuntimeError("Can't Force during autonomous")
         self.forced, self.force_alliance = (True, alliance) if is_start else (False, '')
+        self.owner_table = (alliance,) * 3 if is_start else self.owner_by_tilt
         self.boosted, self.boost_alliance = (False, '')
+        self.owner_cache_time = -1
 
     def boost(self, alliance, is_start):
         """
@@ -684,6 +865,8 @@ class Scale(Agent):
             raise RuntimeError("Can't Boost during autonomous")
         self.boosted, self.boost_alliance = (True, alliance) if is_start else (False, '')
         self.forced, self.force_alliance = (False, '')
+        self.owner_table = self.owner_by_tilt
+        self.owner_cache_time = -1
 
     def owner(self):
         """
@@ -692,10 +875,15 @@ class Scale(Agent):
         ASSUMES: Only the number of Cubes on each Plate determines the tilt;
         this simulation does not model the lever distance of each Cube.
         """
-        if self.forced:
-            return self.force_alliance
-        tilt = self.front_plate.cubes.__cmp__(self.back_plate.cubes)  # <, ==, > :: -1, 0, 1
-        return (self.front_color.opposite, '', self.front_color)[tilt + 1]
+        time = self.simulation.time
+        if time == self.owner_cache_time:
+            return self.owner_cache
+        front, back = self.front_plate.cubes, self.back_plate.cubes
+        tilt = (front > back) - (front < back)  # <, ==, > :: -1, 0, 1
+        owner = self.owner_table[tilt + 1]
+        self.owner_cache_time = time
+        self.owner_cache = owner
+        return owner
 
     def score(self):
         """Returns (red_score, blue_score) earned this time step."""
@@ -710,12 +898,14 @@ class Scale(Agent):
 
 class Switch(Scale):
     """A Switch."""
+    __slots__ = ('active_power_up', 'levitate_activated')
+
     def __init__(self, simulation, power_up_queue, front_color, alliance):
         """
         :param front_color: RED or BLUE, selected by the FMS
         :param alliance: RED or BLUE end of the field
         """
-        super(Switch, self).__init__(
+        super().__init__(
             simulation, power_up_queue, front_color, alliance)
         self.active_power_up = None  # interlock between Force and Boost Power-Ups
         self.levitate_activated = False
@@ -734,23 +924,25 @@ class Switch(Scale):
     def force(self, alliance, is_start):
         """Start/end an alliance Force; no-op if this isn't the alliance's Switch."""
         if alliance is self.alliance:
-            super(Switch, self).force(alliance, is_start)
+            super().force(alliance, is_start)
 
     def boost(self, alliance, is_start):
         """Start/end an alliance Boost; no-op if this isn't the alliance's Switch."""
         if alliance is self.alliance:
-            super(Switch, self).boost(alliance, is_start)
+            super().boost(alliance, is_start)
 
     def owner(self):
-        o = super(Switch, self).owner()
+        o = super().owner()
         return o if o is self.alliance else ''
 
 
 class PowerUpQueue(Agent):
     """The FMS queue of Switch/Scale Power-Ups."""
+    __slots__ = ('queue',)
+
     def __init__(self, simulation):
-        super(PowerUpQueue, self).__init__(simulation, '')
-        self.queue = []  # queue[0] is the current action
+        super().__init__(simulation, '')
+        self.queue = deque()  # queue[0] is the current action
 
     def _start_current_action(self):
         """Start the current action and schedule to end it and revisit the queue."""
@@ -769,21 +961,34 @@ class PowerUpQueue(Agent):
 
     def scheduled_action_done(self):
         """End the current action and revisit the queue."""
-        self.queue.pop(0)(False)
+        self.queue.popleft()(False)
         if self.queue:
             self._start_current_action()
 
 
 class VaultColumn(object):
+    __slots__ = ('alliance', 'action', 'switch', 'scale',
+                 'selected_by_cubes', 'actions_by_cubes',
+                 '_cubes', 'previous_cubes', 'played')
+
     def __init__(self, alliance, action, switch, scale):
         """
         alliance: RED or BLUE.
         action: 'force' or 'boost' (a Scale/Switch method selector) or 'levitate'.
         """
-        super(VaultColumn, self).__init__()
+        super().__init__()
         self.alliance = alliance
         self.action = action
         self.switch, self.scale = switch, scale
+        # The seesaws selected by each possible Cube count, precomputed,
+        # and their bound force/boost methods ('levitate' has none).
+        self.selected_by_cubes = ((), (switch,), (scale,), (switch, scale))
+        if action == 'levitate':
+            self.actions_by_cubes = None
+        else:
+            switch_action, scale_action = getattr(switch, action), getattr(scale, action)
+            self.actions_by_cubes = ((), (switch_action,), (scale_action,),
+                                     (switch_action, scale_action))
 
         self._cubes = 0
         self.previous_cubes = 0
@@ -815,7 +1020,7 @@ class VaultColumn(object):
 
     def selected(self):
         """Returns a tuple of the seesaws selected by the current number of Cubes."""
-        return ((), (self.switch,), (self.scale,), (self.switch, self.scale))[self._cubes]
+        return self.selected_by_cubes[self._cubes]
 
     def activate(self):
         """
@@ -839,11 +1044,12 @@ class VaultColumn(object):
 
             # ASSUMES: The number of Cubes in the Vault column counts when the
             # button is pushed, not when the queued action begins.
-            selected_seesaws = self.selected()
+            alliance = self.alliance
+            bound_actions = self.actions_by_cubes[self._cubes]
 
             def power_up_action(is_start):
-                for seesaw in selected_seesaws:
-                    getattr(seesaw, self.action)(self.alliance, is_start)
+                for action in bound_actions:
+                    action(alliance, is_start)
                 if not is_start:
                     self.switch.active_power_up = None
             self.switch.power_up_queue.run_or_enqueue(power_up_action)
@@ -852,15 +1058,20 @@ class VaultColumn(object):
         return False
 
     def score(self):
-        score = Score.pick(self.alliance, 5 * (self._cubes - self.previous_cubes))
-        self.previous_cubes = self._cubes
+        cubes = self._cubes
+        if cubes == self.previous_cubes:  # the common case: no new Cubes
+            return Score.ZERO
+        score = Score.pick(self.alliance, 5 * (cubes - self.previous_cubes))
+        self.previous_cubes = cubes
         return score
 
 
 class Vault(Agent):
     """An alliance's Vault for power-ups."""
+    __slots__ = ('columns', 'column_map', 'switch', 'scale')
+
     def __init__(self, simulation, alliance, switch, scale):
-        super(Vault, self).__init__(simulation, alliance)
+        super().__init__(simulation, alliance)
         self.columns = tuple(VaultColumn(alliance, action, switch, scale)
                              for action in ('force', 'levitate', 'boost'))
         self.column_map = {column.action: column for column in self.columns}
@@ -882,7 +1093,17 @@ class Vault(Agent):
         return [self.cubes]
 
     def score(self):
-        return sum((column.score() for column in self.columns), Score.ZERO)
+        # Fused over the columns: tally the new Cubes in one pass and
+        # make at most one Score for the whole Vault.
+        new_cubes = 0
+        for column in self.columns:
+            cubes = column._cubes
+            if cubes != column.previous_cubes:
+                new_cubes += cubes - column.previous_cubes
+                column.previous_cubes = cubes
+        if new_cubes == 0:
+            return Score.ZERO
+        return Score.pick(self.alliance, 5 * new_cubes)
 
 
 def example_robot_player(robot):
@@ -899,13 +1120,18 @@ def example_robot_player(robot):
     switch_side = "FRONT" if SWITCH_FRONT_COLOR is alliance else "BACK"
     scale_side = "FRONT" if SCALE_FRONT_COLOR is alliance else "BACK"
 
-    def drive_to(pattern, *args):
-        robot.drive_to(pattern, *args)
+    # Resolve the destination Locations once, not per drive_to() call.
+    switch_inner_zone = find_location("{}_{}_INNER_ZONE", alliance, switch_side)
+    scale_inner_zone = find_location("{}_{}_INNER_ZONE", alliance, scale_side)
+    null_territory = find_location("{}_NULL_TERRITORY", scale_side)
+    exchange_zone = find_location("{}_EXCHANGE_ZONE", alliance)
+    outer_zone = find_location("{}_OUTER_ZONE", alliance)
+    front_inner_zone = find_location("{}_FRONT_INNER_ZONE", alliance)
 
     def player1():
         robot.cubes = 1  # preload a Cube
 
-        drive_to("{}_{}_INNER_ZONE", alliance, switch_side)
+        robot.drive_to(switch_inner_zone)
         yield "auto-run to my Switch plate"
 
         robot.place()
@@ -917,10 +1143,10 @@ def example_robot_player(robot):
     def player2():
         robot.cubes = 1
 
-        drive_to("{}_{}_INNER_ZONE", alliance, scale_side)
+        robot.drive_to(scale_inner_zone)
         yield "auto-run"
 
-        drive_to("{}_NULL_TERRITORY", scale_side)
+        robot.drive_to(null_territory)
         yield "go to my Scale plate"
 
         robot.place()
@@ -932,22 +1158,22 @@ def example_robot_player(robot):
     def player3():
         robot.cubes = 1
 
-        drive_to("{}_EXCHANGE_ZONE", alliance)
+        robot.drive_to(exchange_zone)
         yield "to Exchange"
 
         robot.place()
         yield "place a Cube in the Exchange"
 
-        drive_to("{}_OUTER_ZONE", alliance)
+        robot.drive_to(outer_zone)
         yield "auto-run"
 
-        drive_to("{}_{}_INNER_ZONE", alliance, "FRONT")
+        robot.drive_to(front_inner_zone)
         yield "auto-run"
 
         while True:
             yield "done"
 
-    generator = {1: player1, 2: player2, 3: player3}[robot.position]()
+    generator = (player1, player2, player3)[robot.position - 1]()
     robot.set_player(generator)
 
 
@@ -981,7 +1207,7 @@ def partition_by_alliance(elements):
 
 class PowerUpGame(Simulation):
     def __init__(self, robot_player, human_player):
-        super(PowerUpGame, self).__init__()
+        super().__init__()
 
         # Create and add all the game objects.
         # Construction order affects update() order.
@@ -989,8 +1215,10 @@ class PowerUpGame(Simulation):
 
         self.robots = [Robot(self, alliance, position)
                        for alliance in ALLIANCES
-                       for position in xrange(1, 4)]
+                       for position in range(1, 4)]
         self.robots_map = partition_by_alliance(self.robots)
+        self.red_robots = tuple(self.robots_map[RED])
+        self.blue_robots = tuple(self.robots_map[BLUE])
 
         self.red_switch = Switch(self, pq, SWITCH_FRONT_COLOR, RED)
         self.blue_switch = Switch(self, pq, SWITCH_FRONT_COLOR, BLUE)
@@ -1013,8 +1241,10 @@ class PowerUpGame(Simulation):
         self.auto_switch_owners = Score.ZERO
 
         # Set up the players. Robots can preload Cubes.
-        [robot_player(robot) for robot in self.robots]
-        [human_player(human) for human in self.humans]
+        for robot in self.robots:
+            robot_player(robot)
+        for human in self.humans:
+            human_player(human)
 
         # Now give the remaining Cubes to the Human players at the Portals.
         for alliance in ALLIANCES:
@@ -1025,16 +1255,41 @@ class PowerUpGame(Simulation):
             self.humans_map[(alliance, 'FRONT')].cubes = front_cubes
             self.humans_map[(alliance, 'BACK')].cubes = portal_cubes - front_cubes
 
+        # The roster is complete; freeze it for the per-tick loops and
+        # prebind the scoring methods the loops call on every Agent.
+        self.agent_tuple = tuple(self.agent_list)
+        # Skip Agents that inherit the no-op scorers; polling them would
+        # just collect Score.ZERO.
+        self.agent_score_fns = tuple(
+            a.score for a in self.agent_tuple
+            if type(a).score is not Agent.score)
+        self.agent_endgame_fns = tuple(
+            a.endgame_score for a in self.agent_tuple
+            if type(a).endgame_score is not Agent.endgame_score)
+
+        # The CSV headers are construction-time invariants; build them now.
+        self.csv_contributors = (self,) + self.agent_tuple
+        self.csv_header_row = [cell for c in self.csv_contributors
+                               for cell in c.csv_header()]
+        self.csv_end_header_row = [cell for c in self.csv_contributors
+                                   for cell in c.csv_end_header()]
+
     def tick(self):
         """Advance time and update the running score."""
-        super(PowerUpGame, self).tick()
+        super().tick()
 
         if self.time == AUTONOMOUS_SECS:
             self.auto_switch_owners = Score(int(self.red_switch.owner() is RED),
                                             int(self.blue_switch.owner() is BLUE))
 
-        self.score = sum((agent.score() for agent in self.agents.itervalues()),
-                         self.score)
+        # Accumulate in two ints rather than summing Score tuples, to
+        # allocate one Score per tick instead of one per agent.
+        red, blue = self.score
+        for score_fn in self.agent_score_fns:
+            points = score_fn()
+            red += points[0]
+            blue += points[1]
+        self.score = Score(red, blue)
 
     def endgame_score(self):
         """Credit Levitate Power-Ups then calculate endgame Score points."""
@@ -1042,22 +1297,26 @@ class PowerUpGame(Simulation):
         for switch in self.switches.values():
             if switch.levitate_activated:
                 alliance = switch.alliance
-                robots = self.robots_map[alliance]
-                picks = sorted(robots, key=lambda r: bool(r.climbed) * 2 + r.at_platform)
-                picks[0].climbed = 'Levitated'
+                robots = self.red_robots if alliance is RED else self.blue_robots
+                pick = min(robots, key=lambda r: (bool(r.climbed), r.at_platform))
+                pick.climbed = 'Levitated'
 
-        return sum((agent.endgame_score() for agent in self.agents.itervalues()),
-                   Score.ZERO)
+        red = blue = 0
+        for endgame_fn in self.agent_endgame_fns:
+            points = endgame_fn()
+            red += points[0]
+            blue += points[1]
+        return Score(red, blue)
 
     def face_the_boss_rp(self):
         """Return a Ranking Point Score for Facing the Boss (3-robot climbs)."""
-        return Score(sum(bool(robot.climbed) for robot in self.robots_map[RED]) // 3,
-                     sum(bool(robot.climbed) for robot in self.robots_map[BLUE]) // 3)
+        return Score(sum(1 for robot in self.red_robots if robot.climbed) // 3,
+                     sum(1 for robot in self.blue_robots if robot.climbed) // 3)
 
     def auto_quest_rp(self):
         """Return a Ranking Point Score for the Auto-Quest (3 auto-runs + own Switch)."""
-        reds = sum(robot.auto_run == ScoreFactor.COUNTED for robot in self.robots_map[RED]) // 3
-        blues = sum(robot.auto_run == ScoreFactor.COUNTED for robot in self.robots_map[BLUE]) // 3
+        reds = sum(robot.auto_run is ScoreFactor.COUNTED for robot in self.red_robots) // 3
+        blues = sum(robot.auto_run is ScoreFactor.COUNTED for robot in self.blue_robots) // 3
         return Score(reds * self.auto_switch_owners.red,
                      blues * self.auto_switch_owners.blue)
 
@@ -1078,25 +1337,34 @@ class PowerUpGame(Simulation):
         # TODO: Include # Cubes at each Location in the CSV output?
         csv_writer = csv.writer(output_file)
 
-        csv_contributors = [self] + self.agents.values()
-        header = sum((c.csv_header() for c in csv_contributors), [])
-        csv_writer.writerow(header)
+        csv_contributors = self.csv_contributors
+
+        def collect(methods):
+            """Concatenate the contributors' CSV cells for one row."""
+            row = []
+            for method in methods:
+                row.extend(method())
+            return row
+
+        csv_writer.writerow(self.csv_header_row)
 
-        # Play the match. Output CSV rows.
-        for t in xrange(GAME_SECS):
-            self.tick()
-            row = sum((c.csv_row() for c in csv_contributors), [])
-            csv_writer.writerow(row)
+        # Play the match, buffering a CSV row per tick to write in one
+        # writerows() call after the game loop.
+        csv_row_methods = [c.csv_row for c in csv_contributors]
+        rows = []
+        tick, append = self.tick, rows.append
+        for t in range(GAME_SECS):
+            tick()
+            append(collect(csv_row_methods))
+        csv_writer.writerows(rows)
 
         # Compute endgame points.
         self.score += self.endgame_score()
 
         # Output another CSV section with endgame points.
         csv_writer.writerow(())
-        header = sum((c.csv_end_header() for c in csv_contributors), [])
-        csv_writer.writerow(header)
-        row = sum((c.csv_end_row() for c in csv_contributors), [])
-        csv_writer.writerow(row)
+        csv_writer.writerow(self.csv_end_header_row)
+        csv_writer.writerow(collect([c.csv_end_row for c in csv_contributors]))
 
         # Compute RPs. Output another CSV section.
         wlt = self.score.wlt_rp()
@@ -1107,8 +1375,8 @@ class PowerUpGame(Simulation):
         csv_writer.writerow(('Time', 'WLT RPs', 'AUTO-QUEST RPs', 'BOSS RPs', 'TOTAL RPs'))
         csv_writer.writerow(('Final', wlt, auto_quest, faced_the_boss, rp))
 
-        print "*** Final {}, Ranking Points {}. ***".format(self.score, rp)
-        print
+        print("*** Final {}, Ranking Points {}. ***".format(self.score, rp))
+        print()
 
 
 def play(robot_player, human_player, output_root_name):
@@ -1117,7 +1385,7 @@ def play(robot_player, human_player, output_root_name):
     """
     output_filename = os.path.splitext(os.path.basename(output_root_name))[0] + '.csv'
 
-    with open(output_filename, 'wb') as out:
+    with open(output_filename, 'w', buffering=65536, newline='') as out:
         game = PowerUpGame(robot_player, human_player)
         game.play(out)
 
@@ -8,30 +8,42 @@ TODO: More tests: Robot, Human, Plate, Scale, Switch, PowerUpQueue,
 VaultColumn, Vault, PowerUpGame.
 """
 
-from pytest import raises
+from pytest import mark, raises
 from simulation import *
 
+# Short names for the Locations these tests use repeatedly. A module
+# constant is one LOAD_GLOBAL vs. LOAD_GLOBAL + LOAD_ATTR per reference.
+BFIZ = Location.BLUE_FRONT_INNER_ZONE
+BOZ = Location.BLUE_OUTER_ZONE
+BP = Location.BLUE_PLATFORM
+FNT = Location.FRONT_NULL_TERRITORY
+RFIZ = Location.RED_FRONT_INNER_ZONE
+
 
 class TestSimulation(object):
     def test_find_location(self):
         loc1 = find_location('FRONT_NULL_TERRITORY')
         loc2 = find_location('{}_{}_TERRITORY', 'FRONT', 'NULL')
-        assert loc1 is Location.FRONT_NULL_TERRITORY
+        assert loc1 is FNT
         assert loc1 is loc2
 
     def test_location_travel_times(self):
         """Sample the TRAVEL_TIMES[] dict and location.is_inner_zone ."""
-        bfiz = Location.BLUE_FRONT_INNER_ZONE
-        boz = Location.BLUE_OUTER_ZONE
-        rfiz = Location.RED_FRONT_INNER_ZONE
-        assert TRAVEL_TIMES[(bfiz, boz)] > 0
-        assert TRAVEL_TIMES[(bfiz, boz)] == TRAVEL_TIMES[(boz, bfiz)]
+        assert TRAVEL_TIMES[(BFIZ, BOZ)] > 0
+        assert TRAVEL_TIMES[(BFIZ, BOZ)] == TRAVEL_TIMES[(BOZ, BFIZ)]
+
+        with raises(KeyError):
+            _ = TRAVEL_TIMES[(BFIZ, RFIZ)]
+
+        assert TRAVEL_MATRIX[BFIZ.value][BOZ.value] == TRAVEL_TIMES[(BFIZ, BOZ)]
+        assert TRAVEL_MATRIX[BFIZ.value][RFIZ.value] is None
 
+        assert travel_time(BFIZ, BOZ) == TRAVEL_TIMES[(BFIZ, BOZ)]
         with raises(KeyError):
-            _ = TRAVEL_TIMES[(bfiz, rfiz)]
+            travel_time(BFIZ, RFIZ)
 
-        assert bfiz.is_inner_zone
-        assert not boz.is_inner_zone
+        assert BFIZ.is_inner_zone
+        assert not BOZ.is_inner_zone
 
     def test_typename(self):
         assert typename(self) == 'TestSimulation'
@@ -57,34 +69,30 @@ class TestSimulation(object):
         with raises(AttributeError):
             s.red = 10
 
-    def test_score_wlt(self):
-        s1 = Score(10, 11)
-        assert s1.wlt_rp() == Score(0, 2)
-
-        s2 = Score(100, 11)
-        assert s2.wlt_rp() == Score(2, 0)
-
-        s3 = Score(0, 0)
-        assert s3.wlt_rp() == Score(1, 1)
+    @mark.parametrize('red, blue, expected', [
+        (10, 11, Score(0, 2)),  # BLUE win
+        (100, 11, Score(2, 0)),  # RED win
+        (0, 0, Score(1, 1))])  # tie
+    def test_score_wlt(self, red, blue, expected):
+        assert Score(red, blue).wlt_rp() == expected
 
     def test_sep(self):
         assert sep(3.14) == '3.14 '
         assert sep('') == ''
 
-    def test_agent(self):
+    def test_agent(self, sim):
         """Run basic tests on the Agent class."""
         class Agent99(Agent):
             def __init__(self, simulation, alliance, position):
-                super(Agent99, self).__init__(simulation, alliance, position)
+                super().__init__(simulation, alliance, position)
                 self.actions = 0
 
             def score(self):
-                return super(Agent99, self).score() + Score(self.time + 100, self.actions + 100)
+                return super().score() + Score(self.time + 100, self.actions + 100)
 
             def scheduled_action_done(self):
                 self.actions += 1
 
-        sim = Simulation()
         agent = Agent99(sim, RED, 'best')
         sim.test_actions_done = 0  # test state
 
@@ -107,7 +115,7 @@ class TestSimulation(object):
         assert sim.cubes[Location.BLUE_SWITCH_FENCE] == 6
         assert sim.cubes[Location.RED_POWER_CUBE_ZONE] == 10
         assert sim.cubes[Location.BLUE_POWER_CUBE_ZONE] == 10
-        assert sim.cubes[Location.BLUE_FRONT_INNER_ZONE] == 0
+        assert sim.cubes[BFIZ] == 0
 
         # Schedule an action and step time forward to run it.
         agent.schedule_action(2, doit, 'inc')
@@ -135,18 +143,15 @@ class TestSimulation(object):
 
         assert agent.wait_for_teleop()
         assert agent.time == 2
-        for step in xrange(AUTONOMOUS_SECS - 1):
-            assert agent.autonomous
-            sim.tick()
-            assert sim.test_actions_done == 1
-
+        assert agent.autonomous
+        sim.tick_n(AUTONOMOUS_SECS - 1)
+        assert sim.test_actions_done == 1
         assert not agent.autonomous
         assert agent.actions == 2
         assert agent.score() == Score(116, 102)  # 16 ticks, 2 actions done
 
-    def test_robot(self):
-        sim = Simulation()
-        sim.cubes[Location.BLUE_OUTER_ZONE] = 1
+    def test_robot(self, sim):
+        sim.cubes[BOZ] = 1
 
         robot = Robot(sim, BLUE, 'First-Base')
         robot.pickup_time = 2
@@ -154,7 +159,7 @@ class TestSimulation(object):
         robot.place_time = 2
         robot.climb_time = 2
         assert robot.name == 'BLUE First-Base Robot'
-        assert robot.location is Location.BLUE_OUTER_ZONE
+        assert robot.location is BOZ
         assert robot.cubes == 0
         assert not robot.at_platform
 
@@ -163,22 +168,22 @@ class TestSimulation(object):
 
         # pickup()
         robot.pickup()
-        for _ in xrange(2):
+        for _ in range(2):
             assert robot.cubes == 0
-            assert sim.cubes[Location.BLUE_OUTER_ZONE] == 1
+            assert sim.cubes[BOZ] == 1
             sim.tick()
         assert robot.cubes == 1
-        assert sim.cubes[Location.BLUE_OUTER_ZONE] == 0
+        assert sim.cubes[BOZ] == 0
 
         # drive_to(BLUE_FRONT_INNER_ZONE) and get auto-run points
-        ticks = TRAVEL_TIMES[(Location.BLUE_OUTER_ZONE, Location.BLUE_FRONT_INNER_ZONE)]
+        ticks = TRAVEL_TIMES[(BOZ, BFIZ)]
         assert robot.auto_run is ScoreFactor.NOT_YET
         assert robot.score() == Score.ZERO
-        robot.drive_to(Location.BLUE_FRONT_INNER_ZONE)
-        for _ in xrange(ticks):
-            assert robot.location is Location.BLUE_OUTER_ZONE
+        robot.drive_to(BFIZ)
+        for _ in range(ticks):
+            assert robot.location is BOZ
             sim.tick()
-        assert robot.location is Location.BLUE_FRONT_INNER_ZONE
+        assert robot.location is BFIZ
         assert robot.auto_run is ScoreFactor.ACHIEVED
         assert robot.score() == Score(0, 5)
         assert robot.auto_run is ScoreFactor.COUNTED
@@ -186,14 +191,14 @@ class TestSimulation(object):
         # Try to pickup() but the Robot already has a Cube
         sim.cubes[robot.location] = 1
         robot.pickup()
-        for _ in xrange(2):
+        for _ in range(2):
             sim.tick()
             assert robot.cubes == 1
             assert sim.cubes[robot.location] == 1
 
         # drop()
         robot.drop()
-        for _ in xrange(2):
+        for _ in range(2):
             assert robot.cubes == 1
             assert sim.cubes[robot.location] == 1
             sim.tick()
@@ -201,7 +206,7 @@ class TestSimulation(object):
         assert sim.cubes[robot.location] == 2
 
         # Try to drop() but the Robot has no Cubes
-        for _ in xrange(2):
+        for _ in range(2):
             sim.tick()
             assert robot.cubes == 0
             assert sim.cubes[robot.location] == 2
@@ -209,7 +214,7 @@ class TestSimulation(object):
         # Try to pickup() but no Cubes here
         sim.cubes[robot.location] = 0
         robot.pickup()
-        for _ in xrange(2):
+        for _ in range(2):
             sim.tick()
             assert robot.cubes == 0
             assert sim.cubes[robot.location] == 0
@@ -217,14 +222,14 @@ class TestSimulation(object):
         # Try to place() but no Plate here
         robot.cubes = 1
         robot.place()
-        for _ in xrange(2):
+        for _ in range(2):
             sim.tick()
             assert robot.cubes == 1
 
         # place() on a Plate
         sim.plates[robot.location] = plate = Plate("Gold")
         robot.place()
-        for _ in xrange(2):
+        for _ in range(2):
             assert robot.cubes == 1
             assert plate.cubes == 0
             sim.tick()
@@ -233,7 +238,7 @@ class TestSimulation(object):
 
         # Try to place() but the Robot has no Cubes
         robot.place()
-        for _ in xrange(2):
+        for _ in range(2):
             sim.tick()
             assert robot.cubes == 0
             assert plate.cubes == 1
@@ -243,31 +248,30 @@ class TestSimulation(object):
         assert not robot.scheduled_action  # can't start climbing from off-platform
         assert robot.endgame_score() == Score.ZERO  # didn't get on-platform
 
-        robot.drive_to(Location.BLUE_PLATFORM)
-        ticks = TRAVEL_TIMES[(Location.BLUE_FRONT_INNER_ZONE, Location.BLUE_PLATFORM)]
-        for _ in xrange(ticks):
-            assert robot.location is Location.BLUE_FRONT_INNER_ZONE
+        robot.drive_to(BP)
+        ticks = TRAVEL_TIMES[(BFIZ, BP)]
+        for _ in range(ticks):
+            assert robot.location is BFIZ
             sim.tick()
-        assert robot.location is Location.BLUE_PLATFORM
+        assert robot.location is BP
         assert robot.endgame_score() == Score(0, 5)  # 5 points on-platform
 
         # climb() and TODO: endgame_score()
         robot.climb()
-        for _ in xrange(2):
+        for _ in range(2):
             assert not robot.climbed
             sim.tick()
         assert robot.climbed
         assert robot.endgame_score() == Score(0, 30)  # climbed
 
         # Try to drive() but can't after climbing
-        robot.drive_to(Location.BLUE_FRONT_INNER_ZONE)
+        robot.drive_to(BFIZ)
         assert not robot.scheduled_action  # can't start driving after climbing
 
-    def test_robot_player(self):
+    def test_robot_player(self, sim):
         """Test that a Robot starts its 'player' action generator at the
         beginning and after an impossible climb() doesn't start an action.
         """
-        sim = Simulation()
         robot = Robot(sim, RED, 'Catcher')
         sim.cubes[robot.location] = 1
         robot.climb_time = 10
@@ -290,7 +294,7 @@ class TestSimulation(object):
         sim.tick()
         assert robot.behavior == "not climbing"
 
-        for _ in xrange(robot.pickup_time):
+        for _ in range(robot.pickup_time):
             sim.tick()
             assert robot.cubes == 0
             assert robot.behavior == "picking up"
@@ -298,3 +302,12 @@ class TestSimulation(object):
         sim.tick()
         assert robot.cubes == 1
         assert robot.behavior == "done"
+
+    def test_find_route(self):
+        assert find_route(BOZ, BFIZ) == (BFIZ,)
+        assert find_route(BOZ, FNT) == (BFIZ, FNT)
+        assert SHORTEST_TIME_MATRIX[BOZ.value][FNT.value] == (
+            TRAVEL_TIMES[(BOZ, BFIZ)] + TRAVEL_TIMES[(BFIZ, FNT)])
+
+        with raises(KeyError):
+            find_route(BOZ, Location.BLUE_PLATFORM_CLIMBED)